@@ -0,0 +1,108 @@
+"""
+Shared data processing for the NBA fantasy basketball analysis.
+
+The functions here take and return DataFrames and have no side effects, so
+both the analysis script and the Streamlit dashboard can use them.
+"""
+
+import pandas as pd
+import numpy as np
+
+# Columns converted to numbers during cleaning
+NUMERIC_COLS = ['3PTM', 'AST', 'BLK', 'FG%', 'FT%', 'PTS', 'REB', 'ST', 'TO', 'FGM', 'FGA', 'FTM', 'FTA']
+
+# Select 9 categories for ranking
+FANTASY_CATEGORIES = ['PTS', 'REB', 'AST', 'ST', 'BLK', '3PTM', 'FG%', 'FT%', 'TO']
+
+# Columns of the published ranking table
+OUTPUT_COLS = ['rank', 'full_name', 'editorial_team_abbr', 'primary_position', 'Fantasy_Score'] + FANTASY_CATEGORIES
+
+
+def load_player_stats(path):
+    """
+    Loads the raw player stats CSV and cleans its numeric columns.
+
+    Args:
+        path (str): The path to the player stats CSV file.
+
+    Returns:
+        pd.DataFrame: A DataFrame with FGM/FGA/FTM/FTA split out and all
+                      numeric columns converted.
+    """
+    df = pd.read_csv(path, engine='pyarrow')
+
+    # Split the 'made/attempted' columns in one vectorized pass; rows that are
+    # missing or malformed become NaN
+    fgm_fga = df['FGM/A'].astype(str).str.split('/', n=1, expand=True).reindex(columns=[0, 1])
+    df['FGM'] = pd.to_numeric(fgm_fga[0], errors='coerce')
+    df['FGA'] = pd.to_numeric(fgm_fga[1], errors='coerce')
+    ftm_fta = df['FTM/A'].astype(str).str.split('/', n=1, expand=True).reindex(columns=[0, 1])
+    df['FTM'] = pd.to_numeric(ftm_fta[0], errors='coerce')
+    df['FTA'] = pd.to_numeric(ftm_fta[1], errors='coerce')
+
+    # Convert relevant columns to numeric, setting errors to NaN; percentages
+    # stay float64 so later arithmetic avoids the nullable-integer path
+    for col in NUMERIC_COLS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+        if col in ['FG%', 'FT%']:
+            df[col] = (df[col] * 100).round()
+        else:
+            df[col] = df[col].fillna(0).astype(int)
+
+    return df
+
+
+def rank_players(df, top_n=150):
+    """
+    Ranks players by their 9-category fantasy score.
+
+    Args:
+        df (pd.DataFrame): The cleaned player stats DataFrame.
+        top_n (int): The number of top-scoring players to keep.
+
+    Returns:
+        pd.DataFrame: The top-N players sorted by Fantasy_Score, with Z-score,
+                      Fantasy_Score and rank columns added.
+    """
+    # Create a copy to avoid SettingWithCopyWarning
+    df_fantasy = df.copy()
+
+    # Calculate Z-scores for all categories in one vectorized pass; a zero
+    # standard deviation is replaced by 1 so constant columns score 0
+    df_fantasy[FANTASY_CATEGORIES] = df_fantasy[FANTASY_CATEGORIES].fillna(0)
+    sub = df_fantasy[FANTASY_CATEGORIES].astype('float64')
+    z = (sub - sub.mean()) / sub.std(ddof=1).replace(0, 1)
+    z.columns = [f'Z_{cat}' for cat in FANTASY_CATEGORIES]
+
+    # Invert Z-score for turnovers (negative stat)
+    z['Z_TO'] = -z['Z_TO']
+    df_fantasy[z.columns] = z
+
+    # Calculate total fantasy score
+    df_fantasy['Fantasy_Score'] = z.sum(axis=1)
+
+    # Rank players by fantasy score; nlargest only partially sorts the frame
+    # and skips NaN scores
+    df_fantasy_ranked = df_fantasy.nlargest(top_n, 'Fantasy_Score').reset_index(drop=True)
+
+    # Add rank column
+    df_fantasy_ranked['rank'] = np.arange(1, len(df_fantasy_ranked) + 1)
+
+    return df_fantasy_ranked
+
+
+def build_ranking(path, top_n=150):
+    """
+    Builds the top-N fantasy ranking table from the raw player stats.
+
+    Nothing is printed or written to disk, so the dashboard can call this
+    in-process.
+
+    Args:
+        path (str): The path to the player stats CSV file.
+        top_n (int): The number of players to keep.
+
+    Returns:
+        pd.DataFrame: The top-N players with the OUTPUT_COLS columns.
+    """
+    return rank_players(load_player_stats(path), top_n)[OUTPUT_COLS]
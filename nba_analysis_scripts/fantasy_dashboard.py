@@ -1,87 +1,124 @@
 """
 This module provides a Streamlit dashboard for visualizing NBA fantasy basketball rankings.
 
-It loads player ranking data from a CSV file and presents it in an interactive table
+It loads player ranking data from a Parquet or CSV file and presents it in an interactive table
 and a bar chart, allowing users to filter by position and search for players.
 """
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
-import plotly.express as px
+import altair as alt
 
 # Get the project root directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(script_dir, os.pardir))
-# Define the absolute path to the CSV file
+# Define the absolute paths to the ranking files
 CSV_FILE_PATH = os.path.join(project_root, "data", "nba_fantasy_ranking_top150.csv")
+PARQUET_FILE_PATH = os.path.join(project_root, "data", "nba_fantasy_ranking_top150.parquet")
+# Raw player stats used to build the ranking when neither file exists
+PLAYER_STATS_FILE_PATH = os.path.join(project_root, "data", "nba_player_stats_2025.csv")
 
 st.set_page_config(layout="wide")
 st.title('🏀 Yahoo Fantasy Basketball 2025 Draft Ranking')
 st.markdown('This dashboard provides a predicted ranking of NBA players for your Yahoo Fantasy Basketball league (9-category format), based on the provided 2025 player stats.')
 
-@st.cache_data(ttl=3600)
-def load_data(path):
+@st.cache_data(ttl="1h", max_entries=4, show_spinner=False)
+def load_data(parquet_path, csv_path):
     """
-    Loads player ranking data from a CSV file.
+    Loads player ranking data, preferring the Parquet file over the CSV file
+    unless the CSV is newer.
+
+    If neither file exists, the ranking is built in-process from the raw
+    player stats instead.
 
     Args:
-        path (str): The path to the CSV file.
+        parquet_path (str): The path to the Parquet file.
+        csv_path (str): The path to the CSV file.
 
     Returns:
         pd.DataFrame: A DataFrame containing the player ranking data.
     """
-    if not os.path.exists(path):
-        st.error(f"Error: CSV file not found at {path}. Running analysis script to generate it.")
-        import subprocess
+    # Only trust the Parquet copy if it is not older than the CSV, so a stale
+    # local copy never shadows an updated CSV
+    if os.path.exists(parquet_path) and (
+            not os.path.exists(csv_path) or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)):
+        df = pd.read_parquet(parquet_path)
+    elif os.path.exists(csv_path):
+        df = pd.read_csv(csv_path, engine='pyarrow')
+    else:
+        st.error(f"Error: CSV file not found at {csv_path}. Building the ranking from the player stats instead.")
+        from core import build_ranking
         try:
-            result = subprocess.run(
-                ["python", os.path.join(project_root, "nba_analysis_scripts", "nba_analysis.py")],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-        except subprocess.CalledProcessError as e:
-            st.error(f"Failed to generate CSV file. Error:\n{e.stderr}")
-            return pd.DataFrame()
-        if not os.path.exists(path):
-            st.error(f"Failed to generate CSV file. Please check the logs.")
+            df = build_ranking(PLAYER_STATS_FILE_PATH)
+        except Exception as e:
+            st.error(f"Failed to build the ranking. Error:\n{e}")
             return pd.DataFrame()
-    df = pd.read_csv(path)
-    return df
+    # Lowercase the names once so the search can use a plain substring match,
+    # and store the low-cardinality columns as categoricals
+    return df.assign(
+        _full_name_lc=df['full_name'].str.lower(),
+        primary_position=df['primary_position'].astype('category'),
+        editorial_team_abbr=df['editorial_team_abbr'].astype('category'),
+    )
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def apply_filters(df, position, query):
+    """
+    Filters the ranking by primary position and player name.
+
+    Args:
+        df (pd.DataFrame): The player ranking data.
+        position (str): The primary position to keep, or 'All Positions'.
+        query (str): A case-insensitive substring of the player name.
+
+    Returns:
+        pd.DataFrame: The rows of df matching both filters.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    if position != 'All Positions':
+        mask &= (df['primary_position'] == position).to_numpy()
+    if query:
+        mask &= df['_full_name_lc'].str.contains(query.lower(), regex=False, na=False).to_numpy()
+    return df.iloc[mask]
 
 with st.spinner('Loading data...'):
-    df_ranked = load_data(CSV_FILE_PATH)
+    df_ranked = load_data(PARQUET_FILE_PATH, CSV_FILE_PATH)
 
 if not df_ranked.empty:
     st.sidebar.header('Filter Options')
 
     # Position filter
-    all_positions = ['All Positions'] + sorted(df_ranked['primary_position'].unique().tolist())
+    all_positions = ['All Positions'] + list(df_ranked['primary_position'].cat.categories)
     selected_position = st.sidebar.selectbox('Select Primary Position', all_positions)
 
     # Player search
     search_query = st.sidebar.text_input('Search Player Name', '')
 
     # Apply filters
-    filtered_df = df_ranked.copy()
-    if selected_position != 'All Positions':
-        filtered_df = filtered_df[filtered_df['primary_position'] == selected_position]
-    if search_query:
-        filtered_df = filtered_df[filtered_df['full_name'].str.contains(search_query, case=False, na=False)]
+    filtered_df = apply_filters(df_ranked, selected_position, search_query)
 
     st.subheader('Top 150 Fantasy Players')
     st.write(f'Displaying {len(filtered_df)} of {len(df_ranked)} players.')
-    st.dataframe(filtered_df, use_container_width=True)
+    st.dataframe(
+        filtered_df.drop(columns=['_full_name_lc']),
+        use_container_width=True,
+        column_config={
+            'FG%': st.column_config.NumberColumn(format='%d'),
+            'FT%': st.column_config.NumberColumn(format='%d'),
+        },
+    )
 
     st.subheader('Top 20 Players by Fantasy Score')
     if not filtered_df.empty:
         top_20_players = filtered_df.head(20)
-        fig = px.bar(top_20_players, x='full_name', y='Fantasy_Score', 
-                     color='Fantasy_Score', color_continuous_scale=px.colors.sequential.Viridis,
-                     title='Fantasy Score Distribution for Top 20 Players')
-        fig.update_layout(xaxis_title='Player Name', yaxis_title='Fantasy Score')
-        st.plotly_chart(fig, use_container_width=True)
+        chart = alt.Chart(top_20_players[['full_name', 'Fantasy_Score']], title='Fantasy Score Distribution for Top 20 Players').mark_bar().encode(
+            x=alt.X('full_name', sort=None, title='Player Name'),
+            y=alt.Y('Fantasy_Score', title='Fantasy Score'),
+            color=alt.Color('Fantasy_Score', scale=alt.Scale(scheme='viridis')),
+        )
+        st.altair_chart(chart, use_container_width=True)
     else:
         st.info("No players to display for the selected filters.")
 else:
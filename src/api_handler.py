@@ -5,41 +5,257 @@ This module provides a class to authenticate with the Yahoo API using OAuth2
 and to make requests to various fantasy sports endpoints.
 """
 
+import functools
+import hashlib
 import os
+import tempfile
+import time
+from operator import attrgetter
+
 import yaml
+from cachetools import TTLCache, cachedmethod
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from yahoo_oauth import OAuth2
+from yahoo_oauth.utils import get_data, write_data
+
+# orjson parses the nested Yahoo responses much faster; json.loads accepts
+# the same bytes input, so it works as a drop-in fallback
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+# Only advertise brotli when urllib3 has a decoder for it
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'br, gzip'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip'
+
+# Fields yahoo_oauth needs in a token file to skip its verifier prompt and
+# check the token's age
+TOKEN_KEYS = ('access_token', 'token_type', 'refresh_token', 'token_time')
+
+# Directory for on-disk copies of recent responses
+CACHE_DIR = '.cache'
+
+# How long, in seconds, an on-disk response stays fresh; league data such as
+# current_week changes during the season, so this only covers quick reruns
+DISK_CACHE_TTL = 300
+
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(config_path):
+    """
+    Parses a YAML configuration file, once per path per process.
+
+    Args:
+        config_path (str): Path to the configuration file.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
+
 
 class YahooApiHandler:
     """
 A class to handle authentication and requests to the Yahoo Fantasy API.
     """
-    def __init__(self, config_path='config/config.yaml'):
+    def __init__(self, config_path='config/config.yaml', interactive=False):
         """
         Initializes the YahooApiHandler.
 
         Args:
             config_path (str): Path to the configuration file.
+            interactive (bool): Whether the browser authorization prompt may
+                be used when no stored token is available.
         """
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found at {config_path}")
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
-        
+        self.config = _load_config(config_path)
+        self.interactive = interactive
+
+        # Responses are cached for five minutes to skip repeat round trips
+        self._cache = TTLCache(maxsize=128, ttl=300)
         self.oauth = self._authenticate()
 
     def _authenticate(self):
         """
         Authenticates with the Yahoo API using OAuth2.
 
+        A stored token is refreshed up front if it is about to expire, so an
+        invalid refresh token fails here rather than mid-run. Without a stored
+        token, authorization needs a prompt, which is only allowed in
+        interactive mode.
+
         Returns:
             OAuth2: An authenticated OAuth2 object.
+
+        Raises:
+            RuntimeError: If no usable stored token is available and the
+                handler is not interactive, or if Yahoo rejects the stored
+                refresh token.
         """
-        oauth = OAuth2(self.config['yahoo_api']['consumer_key'],
-                       self.config['yahoo_api']['consumer_secret'])
-        if not oauth.token_is_valid():
-            oauth.refresh_access_token()
+        api_config = self.config['yahoo_api']
+        token_file = api_config.get('token_file')
+        stored = self._read_token_file(token_file) if token_file else {}
+        token = self._normalize_token(stored)
+        if not self.interactive and not all(token.get(key) for key in TOKEN_KEYS):
+            raise RuntimeError("No stored Yahoo OAuth token found. Set yahoo_api.token_file in the "
+                               "configuration and run once with --interactive to authorize the application.")
+        try:
+            if token_file:
+                # yahoo_oauth takes the credentials from the file whenever
+                # from_file is given, so merge the configured ones into it
+                token.update(consumer_key=api_config['consumer_key'],
+                             consumer_secret=api_config['consumer_secret'])
+                if token != stored:
+                    self._save_token_file(token_file, token)
+                # yahoo_oauth would rewrite the file on every construction;
+                # it is saved below only when the token actually changed
+                oauth = OAuth2(None, None, from_file=token_file, store_file=False)
+            else:
+                oauth = OAuth2(api_config['consumer_key'], api_config['consumer_secret'])
+            if not oauth.token_is_valid():
+                oauth.refresh_access_token()
+        except KeyError as e:
+            # yahoo_oauth raises KeyError when the token response carries no
+            # access token, e.g. for a revoked refresh token
+            raise RuntimeError(f"Yahoo rejected the stored OAuth token (missing {e}). "
+                               "Run again with --interactive to re-authorize the application.") from e
+        if token_file and oauth.access_token != token.get('access_token'):
+            token.update({key: getattr(oauth, key) for key in TOKEN_KEYS})
+            self._save_token_file(token_file, token)
+        self._configure_session(oauth.session)
         return oauth
 
+    @staticmethod
+    def _read_token_file(token_file):
+        """
+        Reads a JSON or YAML token file.
+
+        Args:
+            token_file (str): Path to the JSON or YAML token file.
+
+        Returns:
+            dict: The stored token fields, or an empty dict if the file is
+                  missing or does not hold a mapping.
+        """
+        try:
+            token = get_data(token_file)
+        except (OSError, ValueError, yaml.YAMLError):
+            return {}
+        return token if isinstance(token, dict) else {}
+
+    @staticmethod
+    def _normalize_token(token):
+        """
+        Converts stored token fields into yahoo_oauth's format.
+
+        Token files saved by requests-oauthlib (such as yahoo_token.json) carry
+        expires_at instead of token_time; token_time is derived from it.
+
+        Args:
+            token (dict): The stored token fields.
+
+        Returns:
+            dict: A copy of the token with token_time set when derivable.
+        """
+        token = dict(token)
+        if not token.get('token_time') and token.get('expires_at'):
+            token['token_time'] = float(token['expires_at']) - float(token.get('expires_in', 3600))
+        return token
+
+    @staticmethod
+    def _save_token_file(token_file, token):
+        """
+        Atomically writes a token file in the format its extension implies.
+
+        Args:
+            token_file (str): Path to the JSON or YAML token file.
+            token (dict): The token fields to store.
+        """
+        directory, name = os.path.split(os.path.abspath(token_file))
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=os.path.splitext(name)[1], dir=directory)
+        os.close(fd)
+        try:
+            write_data(token, tmp_path)
+            os.replace(tmp_path, token_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _configure_session(self, session):
+        """
+        Enables keep-alive connection pooling, retries and compressed
+        responses on a session.
+
+        Args:
+            session (requests.Session): The session used for API requests.
+        """
+        session.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': ACCEPT_ENCODING})
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        session.mount('https://', adapter)
+
+    def _get(self, url, max_age=None):
+        """
+        Sends a GET request to the Yahoo API and decodes the JSON response.
+
+        Args:
+            url (str): The endpoint URL.
+            max_age (int, optional): If given, a copy of the response saved
+                under CACHE_DIR for the same authorized user less than this
+                many seconds ago is returned instead of calling the API, and
+                fresh responses are saved.
+
+        Returns:
+            dict: The decoded JSON response.
+        """
+        cache_path = None
+        if max_age is not None:
+            # The refresh token identifies the authorized account, so another
+            # user or a re-authorization never reads someone else's responses
+            key = f"{self.oauth.refresh_token}:{url}"
+            cache_path = os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + '.json')
+            try:
+                if os.path.getmtime(cache_path) > time.time() - max_age:
+                    with open(cache_path, 'rb') as f:
+                        return orjson.loads(f.read())
+            except (OSError, ValueError):
+                # A missing or undecodable cache file is a miss
+                pass
+
+        response = self.oauth.session.get(url, params={'format': 'json'})
+        response.raise_for_status()
+        if cache_path is not None:
+            self._write_cache(cache_path, response.content)
+        return orjson.loads(response.content)
+
+    def _write_cache(self, cache_path, content):
+        """
+        Atomically saves a raw response body to the on-disk cache.
+
+        Args:
+            cache_path (str): The cache file to write.
+            content (bytes): The response body.
+        """
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, delete=False) as f:
+            f.write(content)
+        os.replace(f.name, cache_path)
+
+    @cachedmethod(attrgetter('_cache'))
     def get_user_leagues(self):
         """
         Retrieves the user's fantasy baseball leagues.
@@ -48,10 +264,9 @@ A class to handle authentication and requests to the Yahoo Fantasy API.
             dict: A dictionary containing the user's league information.
         """
         url = "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/games;game_keys=mlb/leagues"
-        response = self.oauth.session.get(url, params={'format': 'json'})
-        response.raise_for_status()
-        return response.json()
+        return self._get(url, max_age=DISK_CACHE_TTL)
 
+    @cachedmethod(attrgetter('_cache'))
     def get_league_details(self, league_id):
         """
         Retrieves details for a specific fantasy league.
@@ -63,6 +278,4 @@ A class to handle authentication and requests to the Yahoo Fantasy API.
             dict: A dictionary containing the league details.
         """
         url = f"https://fantasysports.yahooapis.com/fantasy/v2/league/mlb.l.{league_id}"
-        response = self.oauth.session.get(url, params={'format': 'json'})
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+        return self._get(url, max_age=DISK_CACHE_TTL)
\ No newline at end of file
@@ -4,27 +4,55 @@ Main entry point for the Yahoo Fantasy MLB application.
 This script initializes the API handler and retrieves user's fantasy leagues.
 """
 
+import argparse
+import sys
+
 from api_handler import YahooApiHandler
 
+def _leagues_payload(response):
+    """
+    Extracts the leagues collection from a get_user_leagues response.
+
+    Args:
+        response (dict): The decoded get_user_leagues response.
+
+    Returns:
+        dict: The leagues collection for the first game of the logged-in user.
+    """
+    user = response['fantasy_content']['users']['0']['user']
+    game = user[1]['games']['0']['game']
+    return game[1]['leagues']
+
 def main():
     """
     Main function to run the application.
     """
+    parser = argparse.ArgumentParser(description="List your Yahoo Fantasy leagues.")
+    parser.add_argument('--interactive', action='store_true',
+                        help="allow the browser authorization prompt when no stored token exists")
+    args = parser.parse_args()
+
     try:
-        api = YahooApiHandler()
+        api = YahooApiHandler(interactive=args.interactive)
         leagues = api.get_user_leagues()
         print("Available Leagues:")
-        # Simplified parsing for demonstration
-        for league in leagues['fantasy_content']['users']['0']['user'][1]['games']['0']['game'][1]['leagues']:
-            if 'league' in league:
-                league_info = league['league'][0]
-                print(f"  - {league_info['name']} (ID: {league_info['league_id']})")
+        # Simplified parsing for demonstration; Yahoo encodes collections as
+        # {'0': {...}, '1': {...}, 'count': N}, so only the numeric keys hold leagues
+        league_collection = _leagues_payload(leagues)
+        for league in (v for k, v in league_collection.items() if k.isdigit()):
+            league_info = league['league'][0]
+            print(f"  - {league_info['name']} (ID: {league_info['league_id']})")
 
     except FileNotFoundError as e:
         print(f"Error: {e}")
         print("Please ensure your 'config/config.yaml' is set up correctly.")
+        sys.exit(1)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
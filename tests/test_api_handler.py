@@ -0,0 +1,95 @@
+"""
+Tests for building YahooApiHandler from a stored token file.
+"""
+
+import json
+import os
+import sys
+import time
+from unittest import mock
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
+
+from api_handler import YahooApiHandler
+
+
+def _token_response(**fields):
+    """
+    Builds a fake raw access-token response as returned by rauth.
+    """
+    return mock.Mock(content=json.dumps(fields).encode('utf-8'))
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """
+    Writes a config that points yahoo_api.token_file into tmp_path.
+    """
+    path = tmp_path / 'config.yaml'
+    path.write_text(
+        "yahoo_api:\n"
+        "  consumer_key: key\n"
+        "  consumer_secret: secret\n"
+        f"  token_file: {tmp_path / 'token.json'}\n"
+    )
+    return str(path)
+
+
+def _write_token(tmp_path, **fields):
+    (tmp_path / 'token.json').write_text(json.dumps(fields))
+
+
+def test_builds_from_token_file_and_refreshes(tmp_path, config_path):
+    _write_token(tmp_path, access_token='old', token_type='bearer',
+                 refresh_token='refresh', token_time=time.time() - 7200)
+    refreshed = _token_response(access_token='new', token_type='bearer', refresh_token='refresh')
+    with mock.patch('rauth.OAuth2Service.get_raw_access_token', return_value=refreshed) as get_token:
+        api = YahooApiHandler(config_path=config_path)
+
+    get_token.assert_called_once()
+    assert api.oauth.access_token == 'new'
+    assert api.oauth.consumer_key == 'key'
+    saved = json.loads((tmp_path / 'token.json').read_text())
+    assert saved['access_token'] == 'new'
+    assert saved['consumer_secret'] == 'secret'
+
+
+def test_accepts_requests_oauthlib_token_file(tmp_path, config_path):
+    _write_token(tmp_path, access_token='token', token_type='bearer', refresh_token='refresh',
+                 expires_in=3600, expires_at=time.time() + 1800)
+    with mock.patch('rauth.OAuth2Service.get_raw_access_token') as get_token:
+        api = YahooApiHandler(config_path=config_path)
+
+    get_token.assert_not_called()
+    assert api.oauth.access_token == 'token'
+
+
+def test_missing_token_fails_without_prompt(tmp_path, config_path):
+    _write_token(tmp_path, refresh_token='refresh')
+    with mock.patch('builtins.input') as prompt, pytest.raises(RuntimeError, match='No stored'):
+        YahooApiHandler(config_path=config_path)
+    prompt.assert_not_called()
+
+
+def test_revoked_refresh_token_raises_runtime_error(tmp_path, config_path):
+    _write_token(tmp_path, access_token='old', token_type='bearer',
+                 refresh_token='revoked', token_time=time.time() - 7200)
+    rejected = _token_response(error='invalid_grant')
+    with mock.patch('rauth.OAuth2Service.get_raw_access_token', return_value=rejected), \
+            pytest.raises(RuntimeError, match='rejected'):
+        YahooApiHandler(config_path=config_path)
+
+
+def test_unchanged_token_file_is_not_rewritten(tmp_path, config_path):
+    _write_token(tmp_path, access_token='token', token_type='bearer', refresh_token='refresh',
+                 token_time=time.time(), consumer_key='key', consumer_secret='secret')
+    token_path = tmp_path / 'token.json'
+    before = token_path.stat().st_mtime_ns
+    with mock.patch('rauth.OAuth2Service.get_raw_access_token') as get_token:
+        YahooApiHandler(config_path=config_path)
+
+    get_token.assert_not_called()
+    assert token_path.stat().st_mtime_ns == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['config.yaml', 'token.json']